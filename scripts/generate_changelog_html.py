@@ -6,161 +6,255 @@ Usage: python3 scripts/generate_changelog_html.py CHANGELOG.md > docs/site/chang
 
 import re
 import sys
-from datetime import datetime
+from collections import namedtuple
+from functools import lru_cache
+
+# Only the latest releases and the first items of each section are rendered;
+# older releases are not parsed at all
+MAX_RELEASES = 15
+MAX_SECTION_ITEMS = 10
+
+# Changelog patterns are bytes so the file can be scanned straight from mmap.
+# Only header lines are matched; bodies span from one header to the next.
+# Release header: ## [0.1.9] - 2025-12-13; section header: ### Added
+_HEADER_RE = re.compile(
+    rb'^##(?: \[([^\]\n]+)\] - (\d{4}-\d{2}-\d{2})|# ([^\r\n]+))', re.M
+)
+# List item with surrounding whitespace (including CRLF's \r) left outside the
+# group; greedy .* backtracks only over trailing whitespace, unlike a lazy match
+_ITEM_RE = re.compile(rb'^- [ \t\f\v]*(.*\S)?', re.M)
+_BOLD_RE = re.compile(r'\*\*([^*]+)\*\*')
+_MD_INLINE_RE = re.compile(r'\*\*([^*]+)\*\*|`([^`]+)`|\[([^\]]+)\]\(([^)]+)\)')
+
+# Section names mapped to tags, in display order
+SECTION_TAGS = {
+    'Added': ('new', 'New'),
+    'Changed': ('feature', 'Changed'),
+    'Fixed': ('fix', 'Fixed'),
+    'Breaking': ('breaking', 'Breaking'),
+}
+
+# Content keywords mapped to feature tags, in priority order
+KEYWORD_TAGS = {
+    'auth': ('feature', 'Authentication'),
+    'resilience': ('feature', 'Resilience'),
+    'circuit': ('feature', 'Resilience'),
+    'retry': ('feature', 'Resilience'),
+    'cqrs': ('feature', 'CQRS'),
+    'event': ('feature', 'CQRS'),
+    'mcp': ('feature', 'MCP'),
+    'grpc': ('feature', 'Multi-Protocol'),
+    'graphql': ('feature', 'Multi-Protocol'),
+    'protocol': ('feature', 'Multi-Protocol'),
+    'shutdown': ('feature', 'Production-Ready'),
+    'security': ('feature', 'Security'),
+}
+
+_HTML_ESCAPE = str.maketrans({'&': '&amp;', '<': '&lt;', '>': '&gt;'})
+
+_MONTHS = (
+    'January', 'February', 'March', 'April', 'May', 'June',
+    'July', 'August', 'September', 'October', 'November', 'December',
+)
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+_ISO_DATE_RE = re.compile(r'(\d{4})-(\d{2})-(\d{2})', re.ASCII)
+
+
+def _parse_items(content, start, end):
+    """Extract the list items of a section body, scanned in place via pos/endpos."""
+    # Every item is kept: tags and titles look past the rendered MAX_SECTION_ITEMS
+    return [
+        (item_match.group(1) or b'').decode('utf-8')
+        for item_match in _ITEM_RE.finditer(content, start, end)
+    ]
 
 
 def parse_changelog(content):
-    """Parse CHANGELOG.md and extract releases."""
+    """Parse CHANGELOG.md (str, bytes or mmap) and extract the latest releases."""
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+
     releases = []
-    current_release = None
-    current_section = None
-
-    lines = content.split('\n')
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-
-        # Match release header: ## [0.1.9] - 2025-12-13
-        release_match = re.match(r'^## \[([^\]]+)\] - (\d{4}-\d{2}-\d{2})', line)
-        if release_match:
-            if current_release:
-                releases.append(current_release)
-            current_release = {
-                'version': release_match.group(1),
-                'date': release_match.group(2),
+    sections = None
+    section_name = None
+    body_start = 0
+    for header in _HEADER_RE.finditer(content):
+        if section_name:
+            sections[section_name] = _parse_items(content, body_start, header.start())
+
+        version, date, name = header.groups()
+        if version is not None:
+            if len(releases) == MAX_RELEASES:
+                break
+            sections = {}
+            section_name = None
+            releases.append({
+                'version': version.decode('utf-8'),
+                'date': date.decode('utf-8'),
                 'title': '',
                 'tags': [],
-                'sections': {}
-            }
-            current_section = None
-            i += 1
-            continue
-
-        # Match section header: ### Added, ### Changed, ### Fixed
-        section_match = re.match(r'^### (.+)$', line)
-        if section_match and current_release:
-            current_section = section_match.group(1).strip()
-            current_release['sections'][current_section] = []
-            i += 1
-            continue
-
-        # Match list items
-        if line.startswith('- ') and current_release and current_section:
-            item = line[2:].strip()
-            current_release['sections'][current_section].append(item)
-
-        i += 1
-
-    if current_release:
-        releases.append(current_release)
+                'sections': sections
+            })
+        elif sections is not None:
+            section_name = name.strip().decode('utf-8')
+            sections[section_name] = []
+            body_start = header.end()
+    else:
+        if section_name:
+            sections[section_name] = _parse_items(content, body_start, len(content))
 
     return releases
 
 
+@lru_cache(maxsize=64)
 def format_date(date_str):
     """Format date string to human readable."""
-    try:
-        dt = datetime.strptime(date_str, '%Y-%m-%d')
-        return dt.strftime('%B %d, %Y')
-    except:
+    # Dates are fixed ISO YYYY-MM-DD, so validate by hand instead of strptime
+    match = _ISO_DATE_RE.fullmatch(date_str)
+    if not match:
         return date_str
-
-
-def get_tags(release):
-    """Determine tags based on content."""
+    year, month, day = map(int, match.groups())
+    if not 1 <= month <= 12 or year < 1:
+        return date_str
+    leap_day = month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    if not 1 <= day <= _DAYS_IN_MONTH[month - 1] + leap_day:
+        return date_str
+    return f'{_MONTHS[month - 1]} {match.group(3)}, {match.group(1)}'
+
+
+class RenderState:
+    """What a single walk over a release's sections collects for rendering."""
+
+    __slots__ = ('title', 'breaking', 'keyword_hits', 'rendered_items')
+
+    def __init__(self):
+        self.title = None
+        self.breaking = False
+        self.keyword_hits = set()
+        self.rendered_items = {}
+
+
+def _scan_text(text, state):
+    """Record BREAKING markers and tag keywords found in a release's joined text."""
+    state.breaking = 'BREAKING' in text
+    # Plain substring checks run in C and, unlike a regex alternation, see
+    # overlapping keywords such as 'grpcqrs'
+    haystack = text.lower()
+    state.keyword_hits = {keyword for keyword in KEYWORD_TAGS if keyword in haystack}
+
+
+def _first_bold(items):
+    """Return the bold text that starts the first such item, if any."""
+    for item in items:
+        match = _BOLD_RE.match(item)
+        if match:
+            return match.group(1)
+    return None
+
+
+def _walk_sections(release):
+    """Walk every section once, collecting tags, title and rendered item HTML."""
+    state = RenderState()
+    texts = []
+    for section_name, items in release.get('sections', {}).items():
+        texts.append(section_name)
+        texts.extend(items)
+        # Title comes from the first Added item that starts with bold text
+        if section_name == 'Added':
+            state.title = _first_bold(items)
+        state.rendered_items[section_name] = [
+            format_item(item) for item in items[:MAX_SECTION_ITEMS]
+        ]
+    _scan_text(' '.join(texts), state)
+    return state
+
+
+def _tags_from_state(release, state):
+    """Build the release tags from the scanned release text."""
     tags = []
     sections = release.get('sections', {})
 
-    if 'Added' in sections:
-        tags.append(('new', 'New'))
-    if 'Changed' in sections:
-        tags.append(('feature', 'Changed'))
-    if 'Fixed' in sections:
-        tags.append(('fix', 'Fixed'))
-    if 'Breaking' in sections or 'BREAKING' in str(sections):
+    for name, tag in SECTION_TAGS.items():
+        if name in sections:
+            tags.append(tag)
+    if 'Breaking' not in sections and state.breaking:
         tags.append(('breaking', 'Breaking'))
 
     # Add feature tags based on content
-    content = str(sections).lower()
-    if 'auth' in content:
-        tags.append(('feature', 'Authentication'))
-    elif 'resilience' in content or 'circuit' in content or 'retry' in content:
-        tags.append(('feature', 'Resilience'))
-    elif 'cqrs' in content or 'event' in content:
-        tags.append(('feature', 'CQRS'))
-    elif 'mcp' in content:
-        tags.append(('feature', 'MCP'))
-    elif 'grpc' in content or 'graphql' in content or 'protocol' in content:
-        tags.append(('feature', 'Multi-Protocol'))
-    elif 'shutdown' in content:
-        tags.append(('feature', 'Production-Ready'))
-    elif 'security' in content:
-        tags.append(('feature', 'Security'))
-
-    return tags[:4]  # Limit to 4 tags
+    for keyword, tag in KEYWORD_TAGS.items():
+        if keyword in state.keyword_hits:
+            tags.append(tag)
+            break
 
+    return list(dict.fromkeys(tags))[:4]  # Drop duplicates, limit to 4 tags
 
-def get_title(release):
-    """Generate a title from the release content."""
+
+def _title_from_bold(release, bold_title):
+    """Build the release title, falling back when no Added item starts bold."""
+    if bold_title is not None:
+        return bold_title
+
+    added = release.get('sections', {}).get('Added', [])
+    if not added:
+        return f"Version {release['version']}"
+
+    first = added[0]
+    return first[:50] + '...' if len(first) > 50 else first
+
+
+def get_tags(release):
+    """Determine tags based on content."""
     sections = release.get('sections', {})
-    added = sections.get('Added', [])
+    texts = [*sections, *(item for items in sections.values() for item in items)]
+    state = RenderState()
+    _scan_text(' '.join(texts), state)
+    return _tags_from_state(release, state)
 
-    if added:
-        # Get first bold item
-        for item in added:
-            match = re.match(r'\*\*([^*]+)\*\*', item)
-            if match:
-                return match.group(1)
-        return added[0][:50] + '...' if len(added[0]) > 50 else added[0]
 
-    return f"Version {release['version']}"
+def get_title(release):
+    """Generate a title from the release content."""
+    added = release.get('sections', {}).get('Added', [])
+    return _title_from_bold(release, _first_bold(added))
 
 
 def escape_html(text):
     """Escape HTML special characters."""
-    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    return text.translate(_HTML_ESCAPE)
+
+
+def _md_inline_repl(match):
+    """Render one inline markdown match, recursing into nested spans."""
+    bold, code, link_text, link_url = match.groups()
+    if bold is not None:
+        return f'<strong>{format_item(bold)}</strong>'
+    if code is not None:
+        # Bold and links inside code spans are converted, as the chained subs did
+        return f'<code class="code-inline">{format_item(code)}</code>'
+    return f'<a href="{link_url}">{format_item(link_text)}</a>'
 
 
 def format_item(item):
     """Format a changelog item to HTML."""
-    # Convert **bold** to <strong>
-    item = re.sub(r'\*\*([^*]+)\*\*', r'<strong>\1</strong>', item)
-    # Convert `code` to <code class="code-inline">
-    item = re.sub(r'`([^`]+)`', r'<code class="code-inline">\1</code>', item)
-    # Convert [links](url) to <a>
-    item = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'<a href="\2">\1</a>', item)
-    return item
+    # Convert **bold**, `code` and [links](url) in a single pass
+    return _MD_INLINE_RE.sub(_md_inline_repl, item)
 
 
-def generate_release_html(release):
-    """Generate HTML for a single release."""
+# Separators matching the indentation of tags and list items in the page
+_TAG_SEP = '\n                            '
+_ITEM_SEP = '\n                                '
+
+
+def _release_chunks(release):
+    """Yield the HTML for a single release in chunks."""
     version = release['version']
     date = format_date(release['date'])
-    title = get_title(release)
-    tags = get_tags(release)
-    sections = release['sections']
-
-    tags_html = '\n                            '.join([
-        f'<span class="tag {t[0]}">{t[1]}</span>' for t in tags
-    ])
+    state = _walk_sections(release)
+    title = _title_from_bold(release, state.title)
+    tags = _tags_from_state(release, state)
 
-    sections_html = ''
-    for section_name, items in sections.items():
-        if not items:
-            continue
-        items_html = '\n                                '.join([
-            f'<li>{format_item(item)}</li>' for item in items[:10]  # Limit items
-        ])
-        sections_html += f'''
-                        <div class="section">
-                            <h3 class="section-title">{escape_html(section_name)}</h3>
-                            <ul>
-                                {items_html}
-                            </ul>
-                        </div>
-'''
+    tags_html = _TAG_SEP.join(f'<span class="tag {t[0]}">{t[1]}</span>' for t in tags)
 
-    return f'''
+    yield f'''
                 <!-- v{version} -->
                 <div class="release">
                     <div class="release-meta">
@@ -172,12 +266,47 @@ def generate_release_html(release):
                         <div class="release-tags">
                             {tags_html}
                         </div>
-{sections_html}
+'''
+
+    for section_name, items in state.rendered_items.items():
+        if not items:
+            continue
+        items_html = _ITEM_SEP.join(f'<li>{item}</li>' for item in items)
+        yield f'''
+                        <div class="section">
+                            <h3 class="section-title">{escape_html(section_name)}</h3>
+                            <ul>
+                                {items_html}
+                            </ul>
+                        </div>
+'''
+
+    yield '''
                     </div>
                 </div>
 '''
 
 
+# Hashable release key for memoizing rendered HTML; sections keep their order
+Release = namedtuple('Release', 'version date sections')
+
+
+@lru_cache(maxsize=64)
+def _render_release(release):
+    """Render a release key to HTML, memoized across identical releases."""
+    return ''.join(_release_chunks({
+        'version': release.version,
+        'date': release.date,
+        'sections': {name: list(items) for name, items in release.sections},
+    }))
+
+
+def generate_release_html(release):
+    """Generate HTML for a single release, memoized for library callers."""
+    sections = tuple((name, tuple(items)) for name, items in release['sections'].items())
+    return _render_release(Release(release['version'], release['date'], sections))
+
+
 HTML_TEMPLATE = '''<!DOCTYPE html>
 <html lang="en">
 <head>
@@ -443,18 +572,33 @@ HTML_TEMPLATE = '''<!DOCTYPE html>
 '''
 
 
+_TPL_PREFIX, _TPL_SUFFIX = HTML_TEMPLATE.split('{releases_html}', 1)
+
+
 def generate_html(releases):
-    """Generate the full changelog HTML page."""
-    releases_html = ''.join([generate_release_html(r) for r in releases[:15]])  # Limit to 15 releases
-    return HTML_TEMPLATE.replace('{releases_html}', releases_html)
+    """Generate the full changelog HTML page, yielding it in chunks."""
+    yield _TPL_PREFIX
+    for release in releases[:MAX_RELEASES]:
+        yield from _release_chunks(release)
+    yield _TPL_SUFFIX
 
 
 if __name__ == '__main__':
-    changelog_path = sys.argv[1] if len(sys.argv) > 1 else 'CHANGELOG.md'
+    import mmap  # Only the CLI maps files; keep plain imports of this module lean
 
-    with open(changelog_path, 'r') as f:
-        content = f.read()
+    changelog_path = sys.argv[1] if len(sys.argv) > 1 else 'CHANGELOG.md'
 
-    releases = parse_changelog(content)
-    html = generate_html(releases)
-    print(html)
+    with open(changelog_path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            # Empty files, pipes and process substitution cannot be mapped
+            releases = parse_changelog(f.read())
+        else:
+            with mm:
+                releases = parse_changelog(mm)
+
+    write = sys.stdout.write
+    for chunk in generate_html(releases):
+        write(chunk)
+    write('\n')